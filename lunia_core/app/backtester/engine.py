@@ -8,7 +8,7 @@ from typing import List
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     returns: List[float]
     win_rate: float
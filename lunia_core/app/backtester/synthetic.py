@@ -1,13 +1,39 @@
-"""Synthetic data generators for backtesting (placeholder)."""
+"""Synthetic data generators for backtesting."""
 from __future__ import annotations
 
 import logging
-from typing import List
+import math
+import random
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
 
-def generate_gbm(start_price: float, steps: int) -> List[float]:
-    """Placeholder geometric Brownian motion generator."""
-    logger.info("Generating synthetic GBM prices start=%s steps=%s", start_price, steps)
-    return [start_price for _ in range(steps)]
+def generate_gbm(
+    start_price: float,
+    steps: int,
+    *,
+    mu: float = 0.0,
+    sigma: float = 0.02,
+    dt: float = 1.0,
+    seed: Optional[int] = None,
+) -> List[float]:
+    """Generate a geometric Brownian motion price path of ``steps`` points.
+
+    Each step applies the exact log-normal update
+    ``S[t+1] = S[t] * exp((mu - sigma**2 / 2) * dt + sigma * sqrt(dt) * Z)``
+    so prices stay positive. Pass ``seed`` for a reproducible path.
+    """
+    logger.debug("Generating synthetic GBM prices start=%s steps=%s", start_price, steps)
+    if steps <= 0:
+        return []
+    gauss = random.Random(seed).gauss
+    exp = math.exp
+    drift = (mu - 0.5 * sigma * sigma) * dt
+    vol = sigma * math.sqrt(dt)
+    prices = [0.0] * steps
+    price = float(start_price)
+    for idx in range(steps):
+        prices[idx] = price
+        price *= exp(drift + vol * gauss(0.0, 1.0))
+    return prices
@@ -1,13 +1,16 @@
 """Trading agent implementation."""
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TextIO
 
 from ..bus import get_bus
 from ..exchange.base import IExchange
@@ -32,6 +35,60 @@ LOG_PATH = Path(__file__).resolve().parents[4] / "logs" / "trades.jsonl"
 LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 
+class _TradeJournal:
+    """Append-only JSONL journal that keeps its file handle open between trades."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._path: Optional[Path] = None
+        self._fp: Optional[TextIO] = None
+
+    def write(self, path: Path, record: Dict[str, object]) -> None:
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            if self._fp is None or self._path != path:
+                self._close()
+                self._fp = path.open("a", encoding="utf-8")
+                self._path = path
+            self._fp.write(line)
+            self._fp.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def _close(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+        self._fp = None
+        self._path = None
+
+
+_JOURNAL = _TradeJournal()
+atexit.register(_JOURNAL.close)
+
+
+# Resolved metric children, so the order path skips the per-call ``.labels()`` lookup.
+@lru_cache(maxsize=4096)
+def _orders_rejected(symbol: str, side: str, reason: str):
+    return orders_rejected_total.labels(symbol=symbol, side=side, reason=reason)
+
+
+@lru_cache(maxsize=256)
+def _risk_rejected(reason: str):
+    return spot_risk_reject_total.labels(reason=reason)
+
+
+@lru_cache(maxsize=4096)
+def _orders_submitted(symbol: str, side: str):
+    return orders_total.labels(symbol=symbol, side=side)
+
+
+@lru_cache(maxsize=4096)
+def _spot_trades(strategy: str, symbol: str, side: str):
+    return spot_trades_total.labels(strategy=strategy, symbol=symbol, side=side)
+
+
 @dataclass
 class Agent:
     """Trading agent executing spot orders with risk checks and journaling."""
@@ -77,8 +134,8 @@ class Agent:
         if runtime.get("global_stop") or not runtime.get("trading_on", True):
             reason = "trading halted"
             logger.warning("Skipping order due to runtime state: %s", reason)
-            orders_rejected_total.labels(symbol=symbol, side=side.upper(), reason=reason).inc()
-            spot_risk_reject_total.labels(reason=reason).inc()
+            _orders_rejected(symbol, side.upper(), reason).inc()
+            _risk_rejected(reason).inc()
             return {"ok": False, "reason": reason}
         side_upper = side.upper()
         logger.info("Agent received spot order symbol=%s side=%s qty=%.8f", symbol, side_upper, qty)
@@ -92,7 +149,7 @@ class Agent:
         if position and equity > 0:
             current_exposure = abs(position.quantity * market_price) / equity * 100
         record = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
             "symbol": symbol,
             "side": side_upper,
             "qty": qty,
@@ -110,8 +167,8 @@ class Agent:
             record["reason"] = reason
             record["status"] = "REJECTED"
             logger.warning("Risk validation failed: %s", reason)
-            orders_rejected_total.labels(symbol=symbol, side=side_upper, reason=reason).inc()
-            spot_risk_reject_total.labels(reason=reason).inc()
+            _orders_rejected(symbol, side_upper, reason).inc()
+            _risk_rejected(reason).inc()
             self._log_trade(record)
             return {"ok": False, "reason": reason}
 
@@ -132,14 +189,14 @@ class Agent:
             record["reason"] = reason
             record["status"] = "REJECTED"
             logger.warning("Risk validation failed: %s", reason)
-            orders_rejected_total.labels(symbol=symbol, side=side_upper, reason=reason).inc()
-            spot_risk_reject_total.labels(reason=reason).inc()
+            _orders_rejected(symbol, side_upper, reason).inc()
+            _risk_rejected(reason).inc()
             self._log_trade(record)
             return {"ok": False, "reason": reason}
 
         response = self.client.place_order(symbol, side_upper, qty)
-        orders_total.labels(symbol=symbol, side=side_upper).inc()
-        spot_trades_total.labels(strategy=strategy or "unknown", symbol=symbol, side=side_upper).inc()
+        _orders_submitted(symbol, side_upper).inc()
+        _spot_trades(strategy or "unknown", symbol, side_upper).inc()
         record.update(
             {
                 "status": response.get("status", "FILLED"),
@@ -195,7 +252,7 @@ class Agent:
                 qty = notional / price
             if qty <= 0:
                 reason = "invalid-qty"
-                orders_rejected_total.labels(symbol=symbol, side=side, reason=reason).inc()
+                _orders_rejected(symbol, side, reason).inc()
                 errors.append({"symbol": symbol, "side": side, "reason": reason})
                 continue
             result = self.place_spot_order(
@@ -246,6 +303,5 @@ class Agent:
             time.sleep(60)
 
     def _log_trade(self, record: Dict[str, object]) -> None:
-        with LOG_PATH.open("a", encoding="utf-8") as fp:
-            fp.write(json.dumps(record) + "\n")
+        _JOURNAL.write(LOG_PATH, record)
         logger.debug("Trade logged: %s", record)
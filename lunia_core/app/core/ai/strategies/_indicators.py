@@ -0,0 +1,58 @@
+"""Shared numeric helpers for spot strategies.
+
+Strategies run per symbol on every supervisor tick over short float windows.
+``statistics`` computes with exact fractions, which is far slower than the
+float arithmetic used here; ``math.fsum`` keeps the sums correctly rounded.
+"""
+from __future__ import annotations
+
+from itertools import islice
+from math import fsum, sqrt
+from typing import List, Sequence
+
+
+def mean(values: Sequence[float]) -> float:
+    return fsum(values) / len(values)
+
+
+def stdev(values: Sequence[float]) -> float:
+    """Sample standard deviation; 0.0 for fewer than two values."""
+    n = len(values)
+    if n < 2:
+        return 0.0
+    mu = fsum(values) / n
+    return sqrt(max(fsum((x - mu) * (x - mu) for x in values) / (n - 1), 0.0))
+
+
+def pstdev(values: Sequence[float]) -> float:
+    """Population standard deviation; 0.0 for an empty window."""
+    n = len(values)
+    if n == 0:
+        return 0.0
+    mu = fsum(values) / n
+    return sqrt(max(fsum((x - mu) * (x - mu) for x in values) / n, 0.0))
+
+
+def ema(prices: Sequence[float], period: int) -> float:
+    """Exponential moving average seeded with the first price of ``prices``."""
+    if not prices:
+        return 0.0
+    multiplier = 2 / (period + 1)
+    value = prices[0]
+    for price in islice(prices, 1, None):
+        value += (price - value) * multiplier
+    return value
+
+
+def ema_series(prices: Sequence[float], period: int) -> List[float]:
+    """Every intermediate value of :func:`ema`; ``ema_series(p, n)[-1] == ema(p, n)``."""
+    if not prices:
+        return []
+    multiplier = 2 / (period + 1)
+    value = prices[0]
+    series = [value]
+    append = series.append
+    for price in islice(prices, 1, None):
+        value += (price - value) * multiplier
+        append(value)
+    return series
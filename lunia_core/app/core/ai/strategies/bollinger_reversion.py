@@ -1,19 +1,10 @@
 """Bollinger band reversion strategy."""
 from __future__ import annotations
 
-from math import sqrt
-from statistics import mean
 from typing import Dict, Sequence
 
 from . import StrategySignal, register
-
-
-def _stdev(values: Sequence[float]) -> float:
-    if len(values) < 2:
-        return 0.0
-    mu = mean(values)
-    variance = sum((x - mu) ** 2 for x in values) / (len(values) - 1)
-    return sqrt(max(variance, 0.0))
+from ._indicators import mean, stdev
 
 
 def generate(symbol: str, prices: Sequence[float], ctx: Dict[str, float]) -> list[StrategySignal]:
@@ -21,7 +12,7 @@ def generate(symbol: str, prices: Sequence[float], ctx: Dict[str, float]) -> lis
         return []
     window = prices[-20:]
     mid = mean(window)
-    deviation = _stdev(window)
+    deviation = stdev(window)
     if deviation == 0:
         return []
     upper = mid + 2 * deviation
@@ -1,32 +1,18 @@
 """EMA plus RSI trend confirmation strategy."""
 from __future__ import annotations
 
-from typing import Dict, Sequence
+from typing import Dict, Sequence, Tuple
 
 from . import StrategySignal, register
 
-
-def _ema(prices: Sequence[float], period: int) -> float:
-    if not prices:
-        return 0.0
-    multiplier = 2 / (period + 1)
-    ema = prices[0]
-    for price in prices[1:]:
-        ema = (price - ema) * multiplier + ema
-    return ema
+_SLOW_WINDOW = 30
+_FAST_START = 10  # EMA9 is seeded from the last 20 prices of the slow window
+_RSI_START = 16  # RSI(14) uses the deltas of the last 15 prices
+_FAST_MULT = 2 / (9 + 1)
+_SLOW_MULT = 2 / (21 + 1)
 
 
-def _rsi(prices: Sequence[float], period: int = 14) -> float:
-    if len(prices) < period + 1:
-        return 50.0
-    gains = 0.0
-    losses = 0.0
-    for idx in range(-period, 0):
-        delta = prices[idx] - prices[idx - 1]
-        if delta > 0:
-            gains += delta
-        else:
-            losses += abs(delta)
+def _rsi_from(gains: float, losses: float) -> float:
     if losses == 0:
         return 100.0
     if gains == 0:
@@ -35,13 +21,33 @@ def _rsi(prices: Sequence[float], period: int = 14) -> float:
     return 100 - (100 / (1 + rs))
 
 
+def _ema_rsi_fused(prices: Sequence[float]) -> Tuple[float, float, float]:
+    """Return ``(ema_fast, ema_slow, rsi)`` from one pass over the last 30 prices."""
+    window = prices[-_SLOW_WINDOW:]
+    ema_slow = prev = window[0]
+    ema_fast = window[_FAST_START]
+    gains = 0.0
+    losses = 0.0
+    for idx in range(1, _SLOW_WINDOW):
+        price = window[idx]
+        ema_slow += (price - ema_slow) * _SLOW_MULT
+        if idx > _FAST_START:
+            ema_fast += (price - ema_fast) * _FAST_MULT
+        if idx >= _RSI_START:
+            delta = price - prev
+            if delta > 0:
+                gains += delta
+            else:
+                losses -= delta
+        prev = price
+    return ema_fast, ema_slow, _rsi_from(gains, losses)
+
+
 def generate(symbol: str, prices: Sequence[float], ctx: Dict[str, float]) -> list[StrategySignal]:
     if len(prices) < 30:
         return []
     price = prices[-1]
-    ema_fast = _ema(prices[-20:], 9)
-    ema_slow = _ema(prices[-30:], 21)
-    rsi = _rsi(prices[-20:])
+    ema_fast, ema_slow, rsi = _ema_rsi_fused(prices)
     if ema_fast > ema_slow and rsi > 55:
         side = "BUY"
         score = min((rsi - 50) / 10, 5.0)
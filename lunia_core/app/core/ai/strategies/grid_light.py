@@ -10,7 +10,7 @@ def generate(symbol: str, prices: Sequence[float], ctx: Dict[str, float]) -> lis
     if len(prices) < 12:
         return []
     price = prices[-1]
-    median = sorted(prices[-12:])[len(prices[-12:]) // 2]
+    median = sorted(prices[-12:])[6]  # upper median of the 12-price window
     deviation = (price - median) / max(median, 1.0)
     if abs(deviation) < 0.001:
         return []
@@ -4,25 +4,19 @@ from __future__ import annotations
 from typing import Dict, Sequence
 
 from . import StrategySignal, register
+from ._indicators import ema, ema_series
 
-
-def _ema(prices: Sequence[float], period: int) -> float:
-    if not prices:
-        return 0.0
-    multiplier = 2 / (period + 1)
-    ema = prices[0]
-    for price in prices[1:]:
-        ema = (price - ema) * multiplier + ema
-    return ema
+# Slow EMA span plus eight extra points so the signal line sees nine MACD values.
+_WINDOW = 26 + 8
 
 
 def generate(symbol: str, prices: Sequence[float], ctx: Dict[str, float]) -> list[StrategySignal]:
     if len(prices) < 26:
         return []
-    fast = _ema(prices[-26:], 12)
-    slow = _ema(prices[-26:], 26)
-    signal_line = _ema([fast - slow for _ in range(9)], 9)
-    macd_value = fast - slow
+    window = prices[-_WINDOW:]
+    macd = [fast - slow for fast, slow in zip(ema_series(window, 12), ema_series(window, 26))]
+    macd_value = macd[-1]
+    signal_line = ema(macd[-9:], 9)
     histogram = macd_value - signal_line
     if abs(histogram) < 0.0001:
         return []
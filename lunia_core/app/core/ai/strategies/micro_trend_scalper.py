@@ -1,10 +1,10 @@
 """Micro trend scalper strategy implementation."""
 from __future__ import annotations
 
-from statistics import mean
 from typing import Dict, Sequence
 
 from . import StrategySignal, register
+from ._indicators import mean
 
 
 def _momentum(prices: Sequence[float]) -> float:
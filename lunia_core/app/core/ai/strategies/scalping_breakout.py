@@ -1,10 +1,10 @@
 """Scalping breakout strategy with adaptive targets."""
 from __future__ import annotations
 
-from statistics import mean
 from typing import Dict, Sequence
 
 from . import StrategySignal, register
+from ._indicators import mean
 
 
 def generate(symbol: str, prices: Sequence[float], ctx: Dict[str, float]) -> list[StrategySignal]:
@@ -1,10 +1,10 @@
 """Volatility breakout strategy."""
 from __future__ import annotations
 
-from statistics import pstdev
 from typing import Dict, Sequence
 
 from . import StrategySignal, register
+from ._indicators import pstdev
 
 
 def generate(symbol: str, prices: Sequence[float], ctx: Dict[str, float]) -> list[StrategySignal]:
@@ -1,18 +1,21 @@
 """VWAP reversion strategy."""
 from __future__ import annotations
 
+from operator import mul
 from typing import Dict, Sequence
 
 from . import StrategySignal, register
 
+# Linear recency weights over the last 15 prices; sum(1..15) == 120.
+_WEIGHTS = tuple(range(1, 16))
+_WEIGHT_SUM = float(sum(_WEIGHTS))
+
 
 def generate(symbol: str, prices: Sequence[float], ctx: Dict[str, float]) -> list[StrategySignal]:
     if len(prices) < 15:
         return []
     price = prices[-1]
-    weights = list(range(1, len(prices[-15:]) + 1))
-    weighted_sum = sum(p * w for p, w in zip(prices[-15:], weights))
-    vwap = weighted_sum / sum(weights)
+    vwap = sum(map(mul, prices[-15:], _WEIGHTS)) / _WEIGHT_SUM
     deviation = (price - vwap) / max(vwap, 1.0)
     if abs(deviation) < 0.002:
         return []
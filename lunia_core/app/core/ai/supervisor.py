@@ -123,6 +123,8 @@ class Supervisor:
         ctx_extra: Dict[str, float] = dict(context or {})
         ctx_extra.setdefault("sl_pct_default", spot_cfg.get("sl_pct_default", 0.15))
         ctx_extra.setdefault("tp_pct_default", spot_cfg.get("tp_pct_default", 0.30))
+        ctx_extra.setdefault("orderbook_depth_ratio", 0.5)
+        ctx_extra.setdefault("volatility", 0.01)
 
         reference_map = {
             sym: self._collect_prices(sym)
@@ -145,9 +147,8 @@ class Supervisor:
             prices = self._collect_prices(symbol)
             if not prices:
                 continue
-            for name, strategy in REGISTRY.items():
-                ctx_extra.setdefault("orderbook_depth_ratio", context.get("orderbook_depth_ratio", 0.5) if context else 0.5)
-                ctx_extra.setdefault("volatility", context.get("volatility", 0.01) if context else 0.01)
+            priority = self._ai_weight(symbol)
+            for strategy in REGISTRY.values():
                 outputs = strategy(symbol, prices, ctx_extra)
                 for signal in outputs:
                     base = self._strategy_base(signal.strategy, weight_map)
@@ -155,7 +156,6 @@ class Supervisor:
                     if weight <= 0:
                         rejected.append({"strategy": signal.strategy, "reason": "weight-zero"})
                         continue
-                    priority = self._ai_weight(symbol)
                     combined_score = signal.score * weight * priority
                     notional_cap = allocation.per_strategy.get(base, 0.0)
                     risk_size = allocator.risk_size(
@@ -120,18 +120,19 @@ def _parse_simple_yaml(text: str) -> Dict[str, object]:
     current_item: Optional[Dict[str, object]] = None
 
     for raw_line in text.splitlines():
-        if not raw_line.strip() or raw_line.strip().startswith("#"):
-            continue
-        indent = len(raw_line) - len(raw_line.lstrip(" "))
+        # Strip each line once; parse_value() trims values itself.
         stripped = raw_line.strip()
+        if not stripped or stripped[0] == "#":
+            continue
+        is_item = stripped[0] == "-"
 
-        if indent == 0 and not stripped.startswith("-"):
+        if raw_line[0] != " " and not is_item:
             if current_item is not None and current_list is not None:
                 current_list.append(current_item)
                 current_item = None
             current_list = None
-            if ":" in stripped:
-                key, value = stripped.split(":", 1)
+            key, sep, value = stripped.partition(":")
+            if sep:
                 key = key.strip()
                 value = value.strip()
                 if value == "":
@@ -142,7 +143,7 @@ def _parse_simple_yaml(text: str) -> Dict[str, object]:
                     result[key] = parse_value(value)
             continue
 
-        if stripped.startswith("-"):
+        if is_item:
             if current_list is None:
                 current_list = []
                 if current_key:
@@ -150,15 +151,15 @@ def _parse_simple_yaml(text: str) -> Dict[str, object]:
             if current_item is not None:
                 current_list.append(current_item)
             current_item = {}
-            remainder = stripped[1:].strip()
-            if remainder and ":" in remainder:
-                k, v = remainder.split(":", 1)
-                current_item[k.strip()] = parse_value(v.strip())
+            k, sep, v = stripped[1:].partition(":")
+            if sep:
+                current_item[k.strip()] = parse_value(v)
             continue
 
-        if current_item is not None and ":" in stripped:
-            k, v = stripped.split(":", 1)
-            current_item[k.strip()] = parse_value(v.strip())
+        if current_item is not None:
+            k, sep, v = stripped.partition(":")
+            if sep:
+                current_item[k.strip()] = parse_value(v)
 
     if current_item is not None and current_list is not None:
         current_list.append(current_item)
@@ -1,7 +1,6 @@
 """Binance Futures exchange client with mock and testnet support."""
 from __future__ import annotations
 
-import hashlib
 import hmac
 import json
 import logging
@@ -84,7 +83,7 @@ class BinanceFutures(IExchange):
             logger.warning("Missing API secret; cannot sign futures request")
             return None
         query = "&".join(f"{key}={value}" for key, value in params.items())
-        signature = hmac.new(self.api_secret.encode(), query.encode(), hashlib.sha256).hexdigest()
+        signature = hmac.digest(self.api_secret.encode(), query.encode(), "sha256").hex()
         signed = dict(params)
         signed["signature"] = signature
         return signed
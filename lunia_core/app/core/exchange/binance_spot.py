@@ -1,7 +1,6 @@
 """Binance Spot exchange client supporting mock and testnet modes."""
 from __future__ import annotations
 
-import hashlib
 import hmac
 import json
 import logging
@@ -86,7 +85,7 @@ class BinanceSpot(IExchange):
             logger.warning("Missing API secret; cannot sign request. Using mock mode")
             return None
         query = "&".join(f"{key}={value}" for key, value in params.items())
-        signature = hmac.new(self.api_secret.encode(), query.encode(), hashlib.sha256).hexdigest()
+        signature = hmac.digest(self.api_secret.encode(), query.encode(), "sha256").hex()
         signed = dict(params)
         signed["signature"] = signature
         return signed
@@ -1,6 +1,7 @@
 """Flask API exposing Lunia core functionality."""
 from __future__ import annotations
 
+import hmac
 import logging
 import os
 import time
@@ -158,7 +159,8 @@ def _ensure_admin_request() -> bool:
     if OPS_TOKEN is None:
         return True
     header = request.headers.get("X-Admin-Token")
-    if header != OPS_TOKEN:
+    # Constant-time compare on bytes; ``!=`` exits at the first mismatch.
+    if header is None or not hmac.compare_digest(header.encode("utf-8"), OPS_TOKEN.encode("utf-8")):
         logger.warning("Forbidden ops request")
         return False
     return True
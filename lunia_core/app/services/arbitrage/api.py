@@ -1,6 +1,7 @@
 """REST API for arbitrage controls."""
 from __future__ import annotations
 
+import hmac
 import os
 from typing import Any, Dict
 
@@ -25,7 +26,7 @@ def _ensure_admin() -> None:
     if not OPS_TOKEN:
         return
     header = request.headers.get("X-OPS-TOKEN")
-    if header != OPS_TOKEN:
+    if header is None or not hmac.compare_digest(header.encode("utf-8"), OPS_TOKEN.encode("utf-8")):
         raise PermissionError("invalid token")
 
 
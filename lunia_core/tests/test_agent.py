@@ -83,3 +83,18 @@ def test_agent_daily_loss_block(monkeypatch, tmp_path):
     result = agent.place_spot_order("BTCUSDT", "BUY", 0.25)
     assert not result["ok"]
     assert result["reason"] == "max daily loss exceeded"
+
+
+def test_agent_journal_appends_across_orders(tmp_path, monkeypatch):
+    log_path = tmp_path / "trades.jsonl"
+    monkeypatch.setattr("app.core.ai.agent.LOG_PATH", log_path)
+
+    client = DummyExchange(price=100.0)
+    supervisor = Supervisor(client=None)
+    agent = Agent(client=client, risk=RiskManager(), supervisor=supervisor, subscribe_bus=False)
+
+    agent.place_spot_order("BTCUSDT", "BUY", 0.1)
+    agent.place_spot_order("BTCUSDT", "SELL", 0.1)
+
+    records = [json.loads(line) for line in log_path.read_text(encoding="utf-8").splitlines()]
+    assert [record["side"] for record in records] == ["BUY", "SELL"]
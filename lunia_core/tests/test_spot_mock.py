@@ -16,3 +16,24 @@ def test_mock_balances_and_position():
     assert "USDT" in balances
     position = client.get_position("BTCUSDT")
     assert position["symbol"] == "BTCUSDT"
+
+
+def test_signed_params_match_binance_reference_signature():
+    client = BinanceSpot(
+        api_key="k",
+        api_secret="NhqPtmdSJYdKjVHjA7PZj4Mge3R5YNiP1e3UZjInClVN65XAbvqqM6A7H5fATj0j",
+        mock=True,
+    )
+    params = {
+        "symbol": "LTCBTC",
+        "side": "BUY",
+        "type": "LIMIT",
+        "timeInForce": "GTC",
+        "quantity": 1,
+        "price": 0.1,
+        "recvWindow": 5000,
+        "timestamp": 1499827319559,
+    }
+    signed = client._signed_params(params)
+    assert signed["signature"] == "c8db56825ae71d6d79447849e617115f4a920fa2acdcab2b053c4b2838bd6b71"
+    assert "signature" not in params
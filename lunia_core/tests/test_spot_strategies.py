@@ -18,3 +18,14 @@ def test_liquidity_snipe_variants():
     variants = {signal.strategy for signal in signals}
     assert "liquidity_snipe_safe" in variants
     assert "liquidity_snipe_aggressive" in variants
+
+
+def test_macd_crossover_signals_on_accelerating_trend():
+    func = REGISTRY["macd_crossover"]
+    ctx = {"sl_pct_default": 0.15, "tp_pct_default": 0.30}
+    rising = [100 + 0.02 * i * i for i in range(40)]
+    signals = func("BTCUSDT", rising, ctx)
+    assert signals and signals[0].side == "BUY"
+    assert signals[0].meta["hist"] > 0
+    falling = [200 - 0.02 * i * i for i in range(40)]
+    assert func("BTCUSDT", falling, ctx)[0].side == "SELL"
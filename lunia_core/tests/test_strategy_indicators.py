@@ -0,0 +1,46 @@
+import math
+import statistics
+
+from app.core.ai.strategies import _indicators
+
+
+def test_indicators_match_statistics_module():
+    window = [100 + math.sin(i / 3) * 2.5 for i in range(25)]
+    assert math.isclose(_indicators.mean(window), statistics.mean(window))
+    assert math.isclose(_indicators.stdev(window), statistics.stdev(window))
+    assert math.isclose(_indicators.pstdev(window), statistics.pstdev(window))
+
+
+def test_indicators_degenerate_windows():
+    assert _indicators.stdev([5.0]) == 0.0
+    assert _indicators.pstdev([]) == 0.0
+    assert _indicators.pstdev([3.0, 3.0, 3.0]) == 0.0
+
+
+def test_ema_recurrence():
+    assert _indicators.ema([], 9) == 0.0
+    assert _indicators.ema([4.0], 9) == 4.0
+    # multiplier 2 / (3 + 1) = 0.5
+    assert _indicators.ema([10.0, 20.0, 30.0], 3) == 22.5
+
+
+def test_ema_rsi_single_pass_matches_separate_indicators():
+    from app.core.ai.strategies.ema_rsi_trend import _ema_rsi_fused
+
+    prices = [100 + math.sin(i / 4) * 3 + i * 0.1 for i in range(45)]
+    fast, slow, rsi = _ema_rsi_fused(prices)
+    assert fast == _indicators.ema(prices[-20:], 9)
+    assert slow == _indicators.ema(prices[-30:], 21)
+    deltas = [b - a for a, b in zip(prices[-15:-1], prices[-14:])]
+    gains = sum(d for d in deltas if d > 0)
+    losses = -sum(d for d in deltas if d <= 0)
+    assert math.isclose(rsi, 100 - 100 / (1 + gains / losses))
+
+
+def test_ema_series_ends_at_ema():
+    prices = [100 + math.cos(i / 5) * 4 for i in range(30)]
+    series = _indicators.ema_series(prices, 12)
+    assert len(series) == len(prices)
+    assert series[0] == prices[0]
+    assert series[-1] == _indicators.ema(prices, 12)
+    assert _indicators.ema_series([], 12) == []
@@ -0,0 +1,20 @@
+import math
+
+from app.backtester.synthetic import generate_gbm
+
+
+def test_gbm_is_reproducible_and_positive():
+    first = generate_gbm(100.0, 250, sigma=0.05, seed=7)
+    second = generate_gbm(100.0, 250, sigma=0.05, seed=7)
+    assert first == second
+    assert len(first) == 250
+    assert first[0] == 100.0
+    assert min(first) > 0
+    assert len(set(first)) > 1
+
+
+def test_gbm_without_volatility_follows_drift():
+    prices = generate_gbm(50.0, 4, mu=0.01, sigma=0.0)
+    expected = [50.0 * math.exp(0.01 * step) for step in range(4)]
+    assert all(math.isclose(a, b) for a, b in zip(prices, expected))
+    assert generate_gbm(50.0, 0) == []